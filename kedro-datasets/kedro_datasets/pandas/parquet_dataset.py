@@ -5,7 +5,7 @@ import logging
 import warnings
 from copy import deepcopy
 from io import BytesIO
-from pathlib import Path, PurePosixPath
+from pathlib import PurePosixPath
 from typing import Any, Dict
 
 import fsspec
@@ -179,7 +179,8 @@ class ParquetDataset(AbstractVersionedDataset[pd.DataFrame, pd.DataFrame]):
     def _save(self, data: pd.DataFrame) -> None:
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
 
-        if Path(save_path).is_dir():
+        # Checked through fsspec, so that directories on remote storage are caught too
+        if self._fs.isdir(save_path):
             raise DatasetError(
                 f"Saving {self.__class__.__name__} to a directory is not supported."
             )
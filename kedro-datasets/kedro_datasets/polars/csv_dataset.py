@@ -174,8 +174,10 @@ class CSVDataset(AbstractVersionedDataset[pl.DataFrame, pl.DataFrame]):
         buf = BytesIO()
         data.write_csv(file=buf, **self._save_args)
 
+        # getbuffer() hands fsspec a view on the buffer instead of a copy of it
         with self._fs.open(save_path, mode="wb") as fs_file:
-            fs_file.write(buf.getvalue())
+            fs_file.write(buf.getbuffer())
+        buf.close()
 
         self._invalidate_cache()
 
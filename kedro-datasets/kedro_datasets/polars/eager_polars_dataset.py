@@ -167,9 +167,11 @@ class EagerPolarsDataset(AbstractVersionedDataset[pl.DataFrame, pl.DataFrame]):
             )
         buf = BytesIO()
         save_method(buf, **self._save_args)
+        # getbuffer() hands fsspec a view on the buffer instead of a copy of it
         with self._fs.open(save_path, **self._fs_open_args_save) as fs_file:
-            fs_file.write(buf.getvalue())
+            fs_file.write(buf.getbuffer())
             self._invalidate_cache()
+        buf.close()
 
     def _exists(self) -> bool:
         try:
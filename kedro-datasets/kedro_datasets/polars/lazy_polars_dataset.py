@@ -3,10 +3,10 @@ filesystem (e.g.: local, S3, GCS). It uses polars to handle the
 type of read/write target.
 """
 import logging
-from copy import deepcopy
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import PurePosixPath
-from typing import Any, ClassVar, Dict, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple, Union
+from uuid import uuid4
 
 import fsspec
 import polars as pl
@@ -19,7 +19,19 @@ from kedro.io.core import (
     get_protocol_and_path,
 )
 
-ACCEPTED_FILE_FORMATS = ["csv", "parquet"]
+# Polars' scan function and DataFrame write method for each accepted format
+_FORMAT_HOOKS: Dict[str, Tuple[Callable[..., pl.LazyFrame], str]] = {
+    "csv": (pl.scan_csv, "write_csv"),
+    "parquet": (pl.scan_parquet, "write_parquet"),
+}
+
+ACCEPTED_FILE_FORMATS = list(_FORMAT_HOOKS)
+
+# Load arguments applied underneath ``DEFAULT_LOAD_ARGS`` whenever a local file is
+# scanned by Polars itself (rather than through the pyarrow fallback)
+_SCAN_DEFAULT_LOAD_ARGS: Dict[str, Dict[str, Any]] = {
+    "csv": {"rechunk": False},
+}
 
 PolarsFrame = Union[pl.LazyFrame, pl.DataFrame]
 
@@ -106,11 +118,18 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
             load_args: polars options for loading files.
                 Here you can find all available arguments:
                 https://pola-rs.github.io/polars/py-polars/html/reference/io.html
-                All defaults are preserved.
+                All defaults are preserved, except that local CSV files are scanned
+                with `rechunk=False`.
             save_args: Polars options for saving files.
                 Here you can find all available arguments:
                 https://pola-rs.github.io/polars/py-polars/html/reference/io.html
-                All defaults are preserved.
+                All defaults are preserved. For parquet, `partition_cols` saves a
+                hive-partitioned directory at `filepath`, which is written (and
+                loaded) with Arrow. Saving replaces everything already at
+                `filepath`: the new files are written next to the existing ones,
+                which are only deleted once the write succeeded. This is not
+                atomic, so a load during a save, or after an interrupted one,
+                can see the files of both saves.
             version: If specified, should be an instance of
                 ``kedro.io.core.Version``. If its ``load`` attribute is
                 None, the latest version will be loaded. If its ``save``
@@ -125,6 +144,11 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
                 https://filesystem-spec.readthedocs.io/en/latest/api.html#fsspec.spec.AbstractFileSystem.open
                 All defaults are preserved, except `mode`, which is set to `r` when loading
                 and to `w` when saving.
+                For versioned datasets on remote filesystems, loads can be served
+                from a local cache by setting `cache_type` to one of fsspec's caching
+                filesystems (`filecache` or `simplecache`) and optionally
+                `cache_storage` to the local cache directory. Saves always bypass
+                the cache.
             metadata: Any arbitrary metadata.
                 This is ignored by Kedro, but may be consumed by users or external plugins.
         Raises:
@@ -141,8 +165,13 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
                 "https://pola-rs.github.io/polars/py-polars/html/reference/io.html"
             )
 
-        _fs_args = deepcopy(fs_args) or {}
-        _credentials = deepcopy(credentials) or {}
+        self._scan_fn, self._write_attr_name = _FORMAT_HOOKS[self._file_format]
+
+        # Configuration is shallow-copied: only top-level keys are modified below
+        _fs_args = dict(fs_args) if fs_args else {}
+        _cache_type = _fs_args.pop("cache_type", None)
+        _cache_storage = _fs_args.pop("cache_storage", None)
+        _credentials = dict(credentials) if credentials else {}
 
         protocol, path = get_protocol_and_path(filepath, version)
         if protocol == "file":
@@ -152,6 +181,26 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
         self._storage_options = {**_credentials, **_fs_args}
         self._fs = fsspec.filesystem(self._protocol, **self._storage_options)
 
+        # Remote loads can be read through a local cache, so that repeated
+        # reads of the same byte ranges (e.g. parquet footers) don't hit the
+        # object store again; there is nothing to gain for local files. Only
+        # versioned paths are never overwritten, so the cache can't go stale
+        self._load_fs = self._fs
+        if _cache_type and protocol == "file":
+            logger.warning(
+                "Dropping 'cache_type' for local file %s, "
+                "only remote filesystems are read through a cache.",
+                path,
+            )
+        elif _cache_type:
+            if not version:
+                raise DatasetError(
+                    f"'cache_type' is only supported for versioned datasets, please "
+                    f"enable versioning for '{filepath}' or remove 'cache_type'."
+                )
+            _cache_args = {"cache_storage": _cache_storage} if _cache_storage else {}
+            self._load_fs = fsspec.filesystem(_cache_type, fs=self._fs, **_cache_args)
+
         self.metadata = metadata
 
         super().__init__(
@@ -162,12 +211,29 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
         )
 
         # Handle default load and save arguments
-        self._load_args = deepcopy(self.DEFAULT_LOAD_ARGS)
+        self._save_args = {**self.DEFAULT_SAVE_ARGS, **(save_args or {})}
+
+        # Parquet saved with `partition_cols` is a hive-partitioned directory,
+        # an empty list of columns means no partitioning at all
+        if not self._save_args.get("partition_cols", True):
+            self._save_args.pop("partition_cols")
+        self._partitioned = (
+            self._file_format == "parquet" and "partition_cols" in self._save_args
+        )
+
+        # Polars scans local files itself, anything on object storage (and
+        # partitioned datasets) is read through pyarrow
+        self._polars_scan = not self._partitioned and protocol == "file"
+
+        # Format defaults come first, so that subclasses and users can override them
+        self._load_args = {}
+        if self._polars_scan:
+            self._load_args.update(_SCAN_DEFAULT_LOAD_ARGS.get(self._file_format, {}))
+        elif self._partitioned:
+            self._load_args["partitioning"] = "hive"
+        self._load_args.update(self.DEFAULT_LOAD_ARGS)
         if load_args is not None:
             self._load_args.update(load_args)
-        self._save_args = deepcopy(self.DEFAULT_SAVE_ARGS)
-        if save_args is not None:
-            self._save_args.update(save_args)
 
         if "storage_options" in self._save_args or "storage_options" in self._load_args:
             logger.warning(
@@ -190,52 +256,147 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
     def _load(self) -> pl.LazyFrame:
         load_path = str(self._get_load_path())
 
-        if self._protocol == "file":
+        if self._polars_scan:
             # With local filesystems, we can use Polar's build-in I/O method:
-            load_method = getattr(pl, f"scan_{self._file_format}", None)
-            return load_method(load_path, **self._load_args)
+            return self._scan_fn(load_path, **self._load_args)
 
-        # For object storage, we use pyarrow for I/O:
+        # For object storage and partitioned datasets, we use pyarrow for I/O,
+        # which also pushes projections and filters down into the scan:
         dataset = ds.dataset(
-            load_path, filesystem=self._fs, format=self._file_format, **self._load_args
+            load_path,
+            filesystem=self._load_fs,
+            format=self._file_format,
+            **self._load_args,
         )
         return pl.scan_pyarrow_dataset(dataset)
 
     def _save(self, data: Union[pl.DataFrame, pl.LazyFrame]) -> None:
         save_path = get_filepath_str(self._get_save_path(), self._protocol)
+        self._write(data, save_path)
+        self._invalidate_cache()
+
+    def save_many(self, items: Dict[str, PolarsFrame], max_workers: int = 16) -> None:
+        """Saves several frames concurrently, e.g. one per partition. Each frame
+        is written to the path of its key relative to ``filepath``, which is
+        treated as a directory.
+
+        Saving to object storage is dominated by request latency, so writing the
+        frames from a pool of threads rather than one after the other cuts the
+        wall-clock time by up to ``max_workers``.
+
+        Args:
+            items: Mapping of relative file paths to the frames to save there.
+            max_workers: Maximum number of frames written at the same time.
+
+        Raises:
+            DatasetError: When the dataset is versioned, when a key is not a
+                relative path inside ``filepath``, or when any of the frames fails
+                to save.
+        """
+        if self._version:
+            raise DatasetError(
+                f"'save_many' is not supported for versioned datasets, "
+                f"please remove the version from {str(self)}."
+            )
+
+        for key in items:
+            key_path = PurePosixPath(key)
+            if key_path.is_absolute() or ".." in key_path.parts:
+                raise DatasetError(
+                    f"'save_many' keys must be relative paths inside the dataset's "
+                    f"filepath, got '{key}' for {str(self)}."
+                )
 
+        def _write_item(key: str, data: PolarsFrame) -> None:
+            save_path = get_filepath_str(self._filepath / key, self._protocol)
+            self._write(data, save_path)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(_write_item, *item) for item in items.items()]
+                for future in as_completed(futures):
+                    future.result()
+        except Exception as exc:
+            raise DatasetError(
+                f"Failed while saving data to data set {str(self)}.\n{str(exc)}"
+            ) from exc
+        finally:
+            self._invalidate_cache()
+
+    def _write(self, data: PolarsFrame, save_path: str) -> None:
         collected_data = None
         if isinstance(data, pl.LazyFrame):
-            collected_data = data.collect()
+            # The streaming engine runs the query in batches where it can (and
+            # falls back to the default engine where it cannot), which keeps
+            # peak memory down while the plan is being executed
+            collected_data = data.collect(streaming=True)
         else:
             collected_data = data
 
-        # Note: polars does support writing partitioned parquet file
-        # it is leveraging Arrow to do so, see e.g.
+        if self._partitioned:
+            self._write_partitioned(collected_data, save_path)
+            return
+
+        save_method = getattr(collected_data, self._write_attr_name)
+        # Write straight into the fsspec file handle rather than serialising
+        # into an in-memory buffer first, so the data is not held twice. The
+        # file is only committed once the write succeeded, so that a failed
+        # save doesn't leave a truncated file in place of the previous one
+        fs_file = self._fs.open(save_path, mode="wb", autocommit=False)
+        try:
+            with fs_file:
+                save_method(file=fs_file, **self._save_args)
+        except Exception:
+            fs_file.discard()
+            raise
+        fs_file.commit()
+
+    def _write_partitioned(self, data: pl.DataFrame, save_path: str) -> None:
+        # Polars leverages Arrow to write partitioned parquet files, see e.g.
         # https://pola-rs.github.io/polars/py-polars/html/reference/api/polars.DataFrame.write_parquet.html
-        save_method = getattr(collected_data, f"write_{self._file_format}", None)
-        if save_method:
-            buf = BytesIO()
-            save_method(file=buf, **self._save_args)
-            with self._fs.open(save_path, mode="wb") as fs_file:
-                fs_file.write(buf.getvalue())
-                self._invalidate_cache()
-        # How the LazyPolarsDataset logic is currently written with
-        # ACCEPTED_FILE_FORMATS and a check in the `__init__` method,
-        # this else loop is never reached, hence we exclude it from coverage report
-        # but leave it in for consistency between the Eager and Lazy classes
-        else:  # pragma: no cover
-            raise DatasetError(
-                f"Unable to retrieve 'polars.DataFrame.write_{self._file_format}' "
-                "method, please ensure that your 'file_format' parameter has been "
-                "defined correctly as per the Polars API"
-                "https://pola-rs.github.io/polars/py-polars/html/reference/dataframe/index.html"
+        save_args = dict(self._save_args)
+        save_args.pop("use_pyarrow", None)
+        pyarrow_options = {
+            **save_args.pop("pyarrow_options", {}),
+            "partition_cols": save_args.pop("partition_cols"),
+            "filesystem": self._fs,
+            # Unique file names, so that the new files never overwrite the
+            # files of the previous save
+            "basename_template": f"part-{uuid4().hex}-{{i}}.parquet",
+        }
+
+        # Versioned saves always go to a fresh path. Otherwise Arrow adds files
+        # to the existing directory, so the files of the previous save are
+        # deleted once the new ones have been written
+        previous_files = []
+        if not self._version and self._fs.exists(save_path):
+            previous_files = self._fs.find(save_path)
+
+        try:
+            data.write_parquet(
+                save_path,
+                use_pyarrow=True,
+                pyarrow_options=pyarrow_options,
+                **save_args,
             )
+        except Exception:
+            new_files = set(self._fs.find(save_path)) - set(previous_files)
+            if new_files:
+                self._fs.rm(list(new_files))
+            raise
+
+        if previous_files:
+            self._fs.rm(previous_files)
 
     def _exists(self) -> bool:
+        # Only versioned datasets can fail to resolve a load path (when no
+        # version exists yet), so unversioned ones skip the exception handling
+        if not self._version:
+            return self._fs.exists(get_filepath_str(self._filepath, self._protocol))
+
         try:
             load_path = get_filepath_str(self._get_load_path(), self._protocol)
-        except DatasetError:  # pragma: no cover
+        except DatasetError:
             return False
 
         return self._fs.exists(load_path)
@@ -246,5 +407,8 @@ class LazyPolarsDataset(AbstractVersionedDataset[pl.LazyFrame, PolarsFrame]):
 
     def _invalidate_cache(self) -> None:
         """Invalidate underlying filesystem caches."""
+        # The local filesystem doesn't cache directory listings
+        if self._protocol == "file":
+            return
         filepath = get_filepath_str(self._filepath, self._protocol)
         self._fs.invalidate_cache(filepath)
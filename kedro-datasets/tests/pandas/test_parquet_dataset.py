@@ -202,6 +202,14 @@ class TestParquetDataset:
         with pytest.raises(DatasetError, match=pattern):
             dataset.save(dummy_dataframe)
 
+    def test_write_to_non_local_dir(self, tmp_path, dummy_dataframe):
+        dataset = ParquetDataset(filepath=f"memory://bucket/{tmp_path.name}")
+        dataset._fs.pipe(f"{dataset._filepath}/existing.parquet", b"")
+        pattern = "Saving ParquetDataset to a directory is not supported"
+
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.save(dummy_dataframe)
+
     def test_read_from_non_local_dir(self, mocker):
         mock_pandas_call = mocker.patch("pandas.read_parquet")
 
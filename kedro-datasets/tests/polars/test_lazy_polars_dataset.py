@@ -1,4 +1,5 @@
 import re
+from io import BytesIO
 from pathlib import Path, PurePosixPath
 from time import sleep
 
@@ -106,6 +107,18 @@ def mocked_csv_in_s3(mocked_s3_bucket, dummy_dataframe):
     return f"s3://{BUCKET_NAME}/{FILE_NAME}"
 
 
+@pytest.fixture
+def mocked_parquet_in_s3(mocked_s3_bucket, dummy_dataframe):
+    buf = BytesIO()
+    dummy_dataframe.write_parquet(buf)
+    mocked_s3_bucket.put_object(
+        Bucket=BUCKET_NAME,
+        Key="test.pq",
+        Body=buf.getvalue(),
+    )
+    return f"s3://{BUCKET_NAME}/test.pq"
+
+
 class TestLazyCSVDataset:
     """Test class for LazyPolarsDataset csv functionality"""
 
@@ -135,6 +148,37 @@ class TestLazyCSVDataset:
         reloaded_df = csv_data_set.load().collect()
         assert_frame_equal(dummy_dataframe, reloaded_df)
 
+    def test_save_lazy_and_load(self, csv_data_set, dummy_dataframe):
+        """Test that a lazy query is executed on save, including operations
+        the streaming engine does not support."""
+        lazy_query = dummy_dataframe.lazy().with_columns(pl.col("col1").cumsum())
+        csv_data_set.save(lazy_query)
+        reloaded_df = csv_data_set.load().collect()
+        assert_frame_equal(lazy_query.collect(), reloaded_df)
+
+    @pytest.mark.parametrize(
+        "bad_data,save_args",
+        [
+            (pl.DataFrame({"col1": [[1, 2]]}), None),
+            (pl.DataFrame({"col1": [1]}), {"bogus": 1}),
+        ],
+    )
+    def test_failed_save_keeps_previous(
+        self, filepath_csv, dummy_dataframe, bad_data, save_args
+    ):
+        """Test that a failing save leaves the previously saved file untouched."""
+        LazyPolarsDataset(filepath=filepath_csv, file_format="csv").save(
+            dummy_dataframe
+        )
+        dataset = LazyPolarsDataset(
+            filepath=filepath_csv, file_format="csv", save_args=save_args
+        )
+
+        with pytest.raises(DatasetError):
+            dataset.save(bad_data)
+
+        assert_frame_equal(dataset.load().collect(), dummy_dataframe)
+
     def test_load_missing_file(self, csv_data_set):
         """Check the error when trying to load missing file."""
         pattern = r"Failed while loading data from data set LazyPolarsDataset\(.*\)"
@@ -149,6 +193,43 @@ class TestLazyCSVDataset:
         for key, value in load_args.items():
             assert csv_data_set._load_args[key] == value
 
+    def test_config_not_mutated(self, filepath_csv):
+        """Test that the caller's configuration dictionaries are left untouched."""
+        fs_args = {"cache_type": "simplecache"}
+        load_args = {"has_header": False}
+        dataset = LazyPolarsDataset(
+            filepath=filepath_csv,
+            file_format="csv",
+            load_args=load_args,
+            fs_args=fs_args,
+        )
+        dataset._load_args["separator"] = ";"
+        assert fs_args == {"cache_type": "simplecache"}
+        assert load_args == {"has_header": False}
+
+    @pytest.mark.parametrize(
+        "filepath,file_format,expected_load_args",
+        [
+            ("/tmp/test.csv", "csv", {"rechunk": False}),
+            ("/tmp/test.pq", "parquet", {}),
+            ("s3://bucket/test.pq", "parquet", {}),
+            ("s3://bucket/test.csv", "csv", {}),
+        ],
+    )
+    def test_scan_default_load_args(self, filepath, file_format, expected_load_args):
+        """Test that format defaults only apply when Polars scans the file."""
+        dataset = LazyPolarsDataset(filepath=filepath, file_format=file_format)
+        assert dataset._load_args == expected_load_args
+
+    def test_scan_default_load_args_subclass(self, filepath_csv):
+        """Test that a subclass's defaults take precedence over format defaults."""
+
+        class RechunkedDataset(LazyPolarsDataset):
+            DEFAULT_LOAD_ARGS = {"rechunk": True}
+
+        dataset = RechunkedDataset(filepath=filepath_csv, file_format="csv")
+        assert dataset._load_args == {"rechunk": True}
+
     @pytest.mark.parametrize(
         "save_args", [{"k1": "v1", "index": "value"}], indirect=True
     )
@@ -214,13 +295,54 @@ class TestLazyCSVDataset:
 
     def test_catalog_release(self, mocker):
         fs_mock = mocker.patch("fsspec.filesystem").return_value
-        filepath = "test.csv"
-        dataset = LazyPolarsDataset(filepath=filepath, file_format="csv")
+        filepath = "bucket/test.csv"
+        dataset = LazyPolarsDataset(filepath=f"s3://{filepath}", file_format="csv")
         assert dataset._version_cache.currsize == 0  # no cache if unversioned
         dataset.release()
         fs_mock.invalidate_cache.assert_called_once_with(filepath)
         assert dataset._version_cache.currsize == 0
 
+    def test_catalog_release_local(self, mocker):
+        """Test that the local filesystem, which has no cache, isn't invalidated."""
+        fs_mock = mocker.patch("fsspec.filesystem").return_value
+        dataset = LazyPolarsDataset(filepath="test.csv", file_format="csv")
+        dataset.release()
+        fs_mock.invalidate_cache.assert_not_called()
+
+
+class TestLazyParquetDataset:
+    """Test class for LazyPolarsDataset parquet functionality"""
+
+    def test_load_s3(self, dummy_dataframe, mocked_parquet_in_s3):
+        ds = LazyPolarsDataset(mocked_parquet_in_s3, file_format="parquet")
+
+        assert ds._protocol == "s3"
+
+        loaded_df = ds.load().collect()
+        assert_frame_equal(loaded_df, dummy_dataframe)
+
+    def test_load_remote_pushdown(self, tmp_path, dummy_dataframe):
+        """Test that filters on a remote parquet file are pushed into the scan."""
+        dataset = LazyPolarsDataset(
+            filepath=f"memory://bucket/{tmp_path.name}/test.pq", file_format="parquet"
+        )
+        dataset.save(dummy_dataframe)
+
+        query = dataset.load().filter(pl.col("col1") > 1).select("col2")
+        assert "SELECTION" in query.explain()
+        assert_frame_equal(query.collect(), pl.DataFrame({"col2": [5]}))
+
+    def test_load_remote_directory(self, tmp_path, dummy_dataframe):
+        """Test loading a remote directory of parquet files."""
+        filepath = f"memory://bucket/{tmp_path.name}"
+        for part in range(2):
+            LazyPolarsDataset(
+                filepath=f"{filepath}/part-{part}.pq", file_format="parquet"
+            ).save(dummy_dataframe)
+
+        dataset = LazyPolarsDataset(filepath=filepath, file_format="parquet")
+        assert dataset.load().collect().shape == (4, 3)
+
 
 class TestLazyParquetDatasetVersioned:
     def test_load_args(self, parquet_dataset_ignore, dummy_dataframe, filepath_pq):
@@ -228,6 +350,51 @@ class TestLazyParquetDatasetVersioned:
         df = parquet_dataset_ignore.load().collect()
         assert df.shape == (2, 3)
 
+    @pytest.mark.parametrize("cache_type", ["filecache", "simplecache"])
+    def test_load_through_cache(self, dummy_dataframe, tmp_path, cache_type):
+        """Test that remote loads are read through the configured fsspec cache,
+        and that every save is loaded back rather than an earlier cached one."""
+        cache_storage = tmp_path / "cache"
+        ds = LazyPolarsDataset(
+            filepath=f"memory://bucket/{tmp_path.name}/test.pq",
+            file_format="parquet",
+            version=Version(None, None),
+            fs_args={"cache_type": cache_type, "cache_storage": str(cache_storage)},
+        )
+        assert str(ds._filepath) == f"/{tmp_path.name}/test.pq"
+        assert ds._load_fs is not ds._fs
+        assert "cache_type" not in ds._storage_options
+
+        ds.save(dummy_dataframe)
+        assert_frame_equal(dummy_dataframe, ds.load().collect())
+        assert any(cache_storage.iterdir())
+
+        sleep(0.5)
+        new_dataframe = pl.DataFrame({"col1": [9, 9, 9]})
+        ds.save(new_dataframe)
+        assert_frame_equal(new_dataframe, ds.load().collect())
+
+    def test_cache_unversioned(self):
+        """Check the error when caching loads of an unversioned dataset."""
+        pattern = r"'cache_type' is only supported for versioned datasets"
+        with pytest.raises(DatasetError, match=pattern):
+            LazyPolarsDataset(
+                filepath="memory://bucket/test.pq",
+                file_format="parquet",
+                fs_args={"cache_type": "simplecache"},
+            )
+
+    def test_cache_local(self, filepath_pq, caplog):
+        """Check the warning when caching loads of a local file."""
+        ds = LazyPolarsDataset(
+            filepath=filepath_pq,
+            file_format="parquet",
+            version=Version(None, None),
+            fs_args={"cache_type": "simplecache"},
+        )
+        assert ds._load_fs is ds._fs
+        assert "Dropping 'cache_type' for local file" in caplog.text
+
     def test_save_and_load(self, versioned_parquet_dataset, dummy_dataframe):
         """Test saving and reloading the data set."""
         versioned_parquet_dataset.save(dummy_dataframe.lazy())
@@ -343,6 +510,12 @@ class TestLazyParquetDatasetVersioned:
         # dataset B cache is unaffected
         assert ds_b._version_cache.currsize == 2
 
+    def test_exists(self, versioned_parquet_dataset, dummy_dataframe):
+        """Test `exists` method invocation for versioned dataset."""
+        assert not versioned_parquet_dataset.exists()
+        versioned_parquet_dataset.save(dummy_dataframe)
+        assert versioned_parquet_dataset.exists()
+
     def test_no_versions(self, versioned_parquet_dataset):
         """Check the error if no versions are available for load."""
         pattern = r"Did not find any versions for LazyPolarsDataset\(.+\)"
@@ -399,6 +572,144 @@ class TestLazyParquetDatasetVersioned:
         assert versioned_parquet_dataset.exists()
 
 
+class TestLazyParquetDatasetPartitioned:
+    @pytest.mark.parametrize("protocol", ["", "memory://bucket"])
+    def test_save_and_load(self, tmp_path, protocol, dummy_dataframe):
+        """Test saving and reloading a hive-partitioned parquet dataset."""
+        dataset = LazyPolarsDataset(
+            filepath=f"{protocol}{tmp_path.as_posix()}/partitioned",
+            file_format="parquet",
+            save_args={"partition_cols": ["col1"]},
+        )
+        assert dataset._load_args == {"partitioning": "hive"}
+
+        # saving again must not leave the files of the first save behind
+        dataset.save(pl.DataFrame({"col1": [3], "col2": [0], "col3": [0]}).lazy())
+        dataset.save(dummy_dataframe)
+        assert dataset._fs.isdir(f"{dataset._filepath}/col1=1")
+        assert len(dataset._fs.find(str(dataset._filepath))) == 2
+
+        reloaded_df = dataset.load().collect().sort("col2")
+        assert_frame_equal(
+            dummy_dataframe,
+            reloaded_df.select(dummy_dataframe.columns),
+            check_dtype=False,
+        )
+
+    def test_save_and_load_versioned(self, tmp_path, dummy_dataframe):
+        """Test that versioned saves are written straight to their own path."""
+        dataset = LazyPolarsDataset(
+            filepath=(tmp_path / "partitioned").as_posix(),
+            file_format="parquet",
+            save_args={"partition_cols": ["col1"]},
+            version=Version(None, None),
+        )
+        dataset.save(dummy_dataframe)
+
+        save_path = dataset._get_load_path()
+        assert dataset._fs.isdir(f"{save_path}/col1=1")
+        assert [p.name for p in (tmp_path / "partitioned").iterdir()] == [
+            save_path.parent.name
+        ]
+
+        reloaded_df = dataset.load().collect().sort("col2")
+        assert_frame_equal(
+            dummy_dataframe,
+            reloaded_df.select(dummy_dataframe.columns),
+            check_dtype=False,
+        )
+
+    def test_failed_save_keeps_previous(self, tmp_path, dummy_dataframe):
+        """Test that a failing save leaves the previous save untouched."""
+        dataset = LazyPolarsDataset(
+            filepath=(tmp_path / "partitioned").as_posix(),
+            file_format="parquet",
+            save_args={"partition_cols": ["col1"]},
+        )
+        dataset.save(dummy_dataframe)
+        saved_files = dataset._fs.find(str(dataset._filepath))
+
+        with pytest.raises(DatasetError):
+            dataset.save(dummy_dataframe.drop("col1"))
+
+        assert dataset._fs.find(str(dataset._filepath)) == saved_files
+        assert dataset.load().collect().shape == (2, 3)
+
+    def test_partition_cols_in_default_save_args(self, tmp_path):
+        """Test that `partition_cols` set by a subclass's defaults is detected."""
+
+        class PartitionedDataset(LazyPolarsDataset):
+            DEFAULT_SAVE_ARGS = {"partition_cols": ["col1"]}
+
+        dataset = PartitionedDataset(
+            filepath=(tmp_path / "partitioned").as_posix(), file_format="parquet"
+        )
+        assert dataset._partitioned
+        assert dataset._load_args == {"partitioning": "hive"}
+
+    def test_empty_partition_cols(self, filepath_pq, dummy_dataframe):
+        """Test that an empty list of `partition_cols` saves a single file."""
+        dataset = LazyPolarsDataset(
+            filepath=filepath_pq,
+            file_format="parquet",
+            save_args={"partition_cols": []},
+        )
+        assert not dataset._partitioned
+        assert "partition_cols" not in dataset._save_args
+
+        dataset.save(dummy_dataframe)
+        assert_frame_equal(dummy_dataframe, dataset.load().collect())
+
+
+class TestLazyPolarsDatasetSaveMany:
+    def test_save_many(self, tmp_path, dummy_dataframe):
+        """Test that every frame is saved relative to the dataset's filepath."""
+        dataset = LazyPolarsDataset(
+            filepath=(tmp_path / "partitions").as_posix(), file_format="parquet"
+        )
+        items = {
+            f"part={i}/data.pq": dummy_dataframe.lazy().with_columns(pl.lit(i))
+            for i in range(5)
+        }
+        dataset.save_many(items, max_workers=2)
+
+        for key, data in items.items():
+            reloaded_df = LazyPolarsDataset(
+                filepath=(tmp_path / "partitions" / key).as_posix(),
+                file_format="parquet",
+            ).load()
+            assert_frame_equal(data.collect(), reloaded_df.collect())
+
+    def test_save_many_failure(self, tmp_path, dummy_dataframe):
+        """Check the error when one of the frames fails to save."""
+        dataset = LazyPolarsDataset(
+            filepath=tmp_path.as_posix(),
+            file_format="csv",
+            save_args={"not_an_argument": True},
+        )
+        pattern = r"Failed while saving data to data set LazyPolarsDataset\(.+\)"
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.save_many({"a.csv": dummy_dataframe})
+        assert not (tmp_path / "a.csv").exists()
+
+    @pytest.mark.parametrize("key", ["../escaped.csv", "a/../../escaped.csv", "/a.csv"])
+    def test_save_many_outside_filepath(self, tmp_path, dummy_dataframe, key):
+        """Check the error when a key points outside the dataset's filepath."""
+        dataset = LazyPolarsDataset(
+            filepath=(tmp_path / "partitions").as_posix(), file_format="csv"
+        )
+        pattern = r"'save_many' keys must be relative paths inside"
+        with pytest.raises(DatasetError, match=pattern):
+            dataset.save_many({"a.csv": dummy_dataframe, key: dummy_dataframe})
+        assert not any(tmp_path.iterdir())
+
+    def test_save_many_versioned(self, versioned_parquet_dataset, dummy_dataframe):
+        """Check the error when saving many frames to a versioned dataset."""
+        pattern = r"'save_many' is not supported for versioned datasets"
+        with pytest.raises(DatasetError, match=pattern):
+            versioned_parquet_dataset.save_many({"a.pq": dummy_dataframe})
+
+
 class TestBadLazyPolarsDataset:
     def test_bad_file_format_argument(self):
         pattern = (